@@ -18,13 +18,9 @@ import os
 import sys
 import subprocess
 import shutil
-import json
-import webbrowser
+import functools
 from pathlib import Path
 from typing import Optional, Tuple
-import http.server
-import socketserver
-import threading
 
 # ═══════════════════════════════════════════════════════════════════════════
 # CONFIGURATION
@@ -35,6 +31,9 @@ ROOT_DIR = SCRIPT_DIR.parent
 LEARN_DIR = ROOT_DIR / "learn"
 MIX_DIR = ROOT_DIR / "mix"
 
+IS_WIN = sys.platform == "win32"
+IS_MAC = sys.platform == "darwin"
+
 COLORS = {
     "reset": "\033[0m",
     "bold": "\033[1m",
@@ -54,15 +53,31 @@ LESSONS = {
     5: "05-memory-performance",
 }
 
+LESSON_PATHS = {
+    n: {
+        "dir": LEARN_DIR / slug,
+        "demo": LEARN_DIR / slug / "demo.html",
+        "readme": LEARN_DIR / slug / "README.md",
+    }
+    for n, slug in LESSONS.items()
+}
+
 # ═══════════════════════════════════════════════════════════════════════════
 # UTILITIES
 # ═══════════════════════════════════════════════════════════════════════════
 
+if IS_WIN:
+    os.system("")  # Enable ANSI on Windows (once, at import)
+
+_COLOR_FNS = {
+    c: (lambda text, pre=code, post=COLORS["reset"]: f"{pre}{text}{post}")
+    for c, code in COLORS.items()
+}
+
+
 def color(text: str, c: str) -> str:
     """Wrap text in ANSI color codes."""
-    if sys.platform == "win32":
-        os.system("")  # Enable ANSI on Windows
-    return f"{COLORS.get(c, '')}{text}{COLORS['reset']}"
+    return _COLOR_FNS[c](text)
 
 
 def print_banner():
@@ -79,21 +94,70 @@ def print_banner():
     print(color("  WebAssembly Learning Hub CLI Tool\n", "bold"))
 
 
-def check_command(cmd: str) -> Tuple[bool, str]:
-    """Check if a command is available and get its version."""
-    try:
-        result = subprocess.run(
-            [cmd, "--version"],
+def _run_version(path: str) -> str:
+    """Return the stdout of `<path> --version`."""
+    if not hasattr(os, "posix_spawn"):
+        return subprocess.run(
+            [path, "--version"],
             capture_output=True,
-            text=True,
-            timeout=10
-        )
-        version = result.stdout.strip().split("\n")[0]
+            text=True
+        ).stdout
+    
+    # posix_spawn skips subprocess's close_fds scan and error-pipe bookkeeping.
+    # Our pipe ends are CLOEXEC, so concurrent probes don't hold each other's
+    # write ends open; any other inheritable fds in this process do reach the
+    # child, which is an accepted trade-off for a short-lived `--version` run.
+    r, w = os.pipe()
+    try:
+        pid = os.posix_spawn(path, [path, "--version"], os.environ, file_actions=[
+            (os.POSIX_SPAWN_DUP2, w, 1),
+            (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+        ])
+    except OSError:
+        os.close(r)
+        raise
+    finally:
+        os.close(w)
+    
+    chunks = []
+    try:
+        while True:
+            chunk = os.read(r, 4096)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(r)
+        os.waitpid(pid, 0)
+    return b"".join(chunks).decode(errors="replace")
+
+
+@functools.lru_cache(maxsize=None)
+def check_command(cmd: str, need_version: bool = True) -> Tuple[bool, str]:
+    """Check if a command is available and get its version (cached per run)."""
+    path = shutil.which(cmd)
+    if path is None:
+        return False, ""
+    if not need_version:
+        return True, ""
+    try:
+        version = _run_version(path).lstrip().partition("\n")[0].rstrip()
         return True, version
-    except (subprocess.TimeoutExpired, FileNotFoundError):
+    except OSError:
         return False, ""
 
 
+def _can_open_browser() -> bool:
+    """Return False in CI, SSH and other headless sessions where a browser can't open."""
+    if os.environ.get("CI") or os.environ.get("WASM_CLI_NO_BROWSER"):
+        return False
+    if os.environ.get("SSH_CONNECTION") or os.environ.get("SSH_TTY"):
+        return False
+    if not (IS_WIN or IS_MAC) and not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")):
+        return False
+    return sys.stdout.isatty()
+
+
 def run_command(cmd: list, cwd: Optional[Path] = None, show_output: bool = True) -> bool:
     """Run a command and return success status."""
     try:
@@ -106,14 +170,159 @@ def run_command(cmd: list, cwd: Optional[Path] = None, show_output: bool = True)
         return False
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# TEMPLATES
+# ═══════════════════════════════════════════════════════════════════════════
+
+# Project templates for `new`, filled in with str.format_map({"name": ...})
+
+MAIN_C_TEMPLATE = '''// {name} - WASM module compiled from C
+#include <emscripten.h>
+#include <string.h>
+#include <stdlib.h>
+
+EMSCRIPTEN_KEEPALIVE
+int add(int a, int b) {{
+    return a + b;
+}}
+
+EMSCRIPTEN_KEEPALIVE
+int multiply(int a, int b) {{
+    return a * b;
+}}
+
+EMSCRIPTEN_KEEPALIVE __attribute__((const))
+int factorial(int n) {{
+    int result = 1;
+    for (int i = 2; i <= n; i++) {{
+        result *= i;
+    }}
+    return result;
+}}
+
+EMSCRIPTEN_KEEPALIVE
+char* greet(const char* name) {{
+    static char buffer[256];
+    snprintf(buffer, sizeof(buffer), "Hello, %s!", name);
+    return buffer;
+}}
+
+int main() {{
+    return 0;
+}}
+'''
+
+INDEX_HTML_TEMPLATE = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{name}</title>
+    <style>
+        body {{
+            font-family: system-ui, sans-serif;
+            max-width: 800px;
+            margin: 2rem auto;
+            padding: 1rem;
+            background: #1e1e1e;
+            color: #d4d4d4;
+        }}
+        h1 {{ color: #00d4ff; }}
+        .result {{
+            background: #0a0a15;
+            padding: 1rem;
+            border-radius: 8px;
+            font-family: monospace;
+            margin: 1rem 0;
+        }}
+        button {{
+            background: linear-gradient(90deg, #00d4ff, #7c3aed);
+            border: none;
+            padding: 0.8rem 1.5rem;
+            border-radius: 8px;
+            color: white;
+            cursor: pointer;
+            margin: 0.5rem;
+        }}
+    </style>
+</head>
+<body>
+    <h1>🚀 {name}</h1>
+    <p>Your C/WASM module is ready!</p>
+    
+    <div class="result" id="output">Loading WASM...</div>
+    
+    <button onclick="testAdd()">Test Add(5, 3)</button>
+    <button onclick="testFactorial()">Test Factorial(6)</button>
+    <button onclick="testGreet()">Test Greet</button>
+    
+    <script>
+        var Module = {{
+            onRuntimeInitialized: function() {{
+                document.getElementById('output').textContent = '✅ WASM loaded!';
+            }}
+        }};
+        
+        function testAdd() {{
+            const result = Module._add(5, 3);
+            document.getElementById('output').textContent = `add(5, 3) = ${{result}}`;
+        }}
+        
+        function testFactorial() {{
+            const result = Module._factorial(6);
+            document.getElementById('output').textContent = `factorial(6) = ${{result}}`;
+        }}
+        
+        function testGreet() {{
+            const greet = Module.cwrap('greet', 'string', ['string']);
+            document.getElementById('output').textContent = greet('WASM Developer');
+        }}
+    </script>
+    <script src="main.js"></script>
+</body>
+</html>
+'''
+
+BUILD_BAT_TEMPLATE = '''@echo off
+echo Building {name}...
+emcc src/main.c -o www/main.js ^
+    -s WASM=1 ^
+    -s EXPORTED_FUNCTIONS="['_add', '_multiply', '_factorial', '_greet', '_main']" ^
+    -s EXPORTED_RUNTIME_METHODS="['ccall', 'cwrap']" ^
+    -O2
+echo Done! Open www/index.html in your browser.
+'''
+
+BUILD_SH_TEMPLATE = '''#!/bin/bash
+set -e
+echo "Building {name}... (when done, open www/index.html in your browser)"
+exec emcc src/main.c -o www/main.js \\
+    -s WASM=1 \\
+    -s EXPORTED_FUNCTIONS="['_add', '_multiply', '_factorial', '_greet', '_main']" \\
+    -s EXPORTED_RUNTIME_METHODS="['ccall', 'cwrap']" \\
+    -O2
+'''
+
+# (relative path, template, file mode)
+TEMPLATE_FILES = (
+    ("src/main.c", MAIN_C_TEMPLATE, 0o644),
+    ("www/index.html", INDEX_HTML_TEMPLATE, 0o644),
+    # Files are written in binary mode; cmd.exe expects CRLF in batch files
+    ("build.bat", BUILD_BAT_TEMPLATE.replace("\n", "\r\n"), 0o644) if IS_WIN
+    else ("build.sh", BUILD_SH_TEMPLATE, 0o755),
+)
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # COMMANDS
 # ═══════════════════════════════════════════════════════════════════════════
 
 def cmd_check():
     """Check the development environment."""
-    print(color("\n🔍 Checking Development Environment\n", "bold"))
-    print("=" * 50)
+    import concurrent.futures
+    
+    # Output is collected into `lines` and written in as few calls as possible
+    lines = [color("\n🔍 Checking Development Environment\n", "bold"), "=" * 50]
     
     checks = [
         ("Python", "python", "Required for this CLI"),
@@ -122,25 +331,35 @@ def cmd_check():
         ("wabt (wat2wasm)", "wat2wasm", "WAT to WASM compiler (optional)"),
     ]
     
+    # Probes are independent and spend their time waiting on child processes,
+    # so run them together and report each one as soon as it finishes
     all_good = True
-    for name, cmd, description in checks:
-        found, version = check_command(cmd)
-        if found:
-            print(f"  {color('✓', 'green')} {name}: {color(version, 'cyan')}")
-        else:
-            if cmd in ["emcc", "python"]:
-                print(f"  {color('✗', 'red')} {name}: {color('Not found', 'yellow')} - {description}")
-                all_good = False
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(checks)) as ex:
+        futures = {ex.submit(check_command, cmd): (name, cmd, description) for name, cmd, description in checks}
+        for future in concurrent.futures.as_completed(futures):
+            name, cmd, description = futures[future]
+            found, version = future.result()
+            if found:
+                lines.append(f"  {color('✓', 'green')} {name}: {color(version, 'cyan')}")
             else:
-                print(f"  {color('○', 'yellow')} {name}: {color('Not found (optional)', 'yellow')} - {description}")
-    
-    print("=" * 50)
+                if cmd in ["emcc", "python"]:
+                    lines.append(f"  {color('✗', 'red')} {name}: {color('Not found', 'yellow')} - {description}")
+                    all_good = False
+                else:
+                    lines.append(f"  {color('○', 'yellow')} {name}: {color('Not found (optional)', 'yellow')} - {description}")
+            # Flush per completed probe so progress still streams
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+            lines.clear()
+    
+    lines.append("=" * 50)
     
     if all_good:
-        print(color("\n✅ All required tools installed! You're ready to go.\n", "green"))
+        lines.append(color("\n✅ All required tools installed! You're ready to go.\n", "green"))
     else:
-        print(color("\n⚠️  Some required tools are missing. Run 'python wasm-cli.py setup' to install.\n", "yellow"))
+        lines.append(color("\n⚠️  Some required tools are missing. Run 'python wasm-cli.py setup' to install.\n", "yellow"))
     
+    sys.stdout.write("\n".join(lines) + "\n")
     return all_good
 
 
@@ -151,10 +370,9 @@ def cmd_setup():
     steps = []
     
     # Check Emscripten
-    emcc_found, _ = check_command("emcc")
+    emcc_found, _ = check_command("emcc", need_version=False)
     if not emcc_found:
-        import sys
-        if sys.platform == "win32":
+        if IS_WIN:
             steps.append(("Install Emscripten", [
                 "git clone https://github.com/emscripten-core/emsdk.git",
                 "cd emsdk",
@@ -162,7 +380,7 @@ def cmd_setup():
                 "emsdk activate latest",
                 "emsdk_env.bat  (run in each new terminal)"
             ]))
-        elif sys.platform == "darwin":
+        elif IS_MAC:
             steps.append(("Install Emscripten", [
                 "brew install emscripten",
                 "Or: git clone https://github.com/emscripten-core/emsdk.git && cd emsdk && ./emsdk install latest && ./emsdk activate latest"
@@ -177,7 +395,7 @@ def cmd_setup():
         print(f"  {color('✓', 'green')} Emscripten already installed")
     
     # Check Node.js
-    node_found, _ = check_command("node")
+    node_found, _ = check_command("node", need_version=False)
     if not node_found:
         steps.append(("Install Node.js", ["Visit https://nodejs.org/ and download LTS version"]))
     else:
@@ -203,9 +421,9 @@ def cmd_lesson(lesson_num: int):
         print(f"   Available lessons: 1-{len(LESSONS)}\n")
         return
     
-    lesson_dir = LEARN_DIR / LESSONS[lesson_num]
-    demo_file = lesson_dir / "demo.html"
-    readme_file = lesson_dir / "README.md"
+    paths = LESSON_PATHS[lesson_num]
+    demo_file = paths["demo"]
+    readme_file = paths["readme"]
     
     print(color(f"\n📖 Opening Lesson {lesson_num}: {LESSONS[lesson_num]}\n", "bold"))
     
@@ -214,8 +432,10 @@ def cmd_lesson(lesson_num: int):
     
     if demo_file.exists():
         print(f"  Demo:   {demo_file}")
-        print(color("\n  Opening demo in browser...", "cyan"))
-        webbrowser.open(f"file://{demo_file}")
+        if _can_open_browser():
+            import webbrowser
+            print(color("\n  Opening demo in browser...", "cyan"))
+            webbrowser.open(f"file://{demo_file}")
     else:
         print(color("  No demo.html found for this lesson", "yellow"))
 
@@ -231,37 +451,127 @@ def cmd_build():
     print(color("\n🔨 Building C → WASM...\n", "bold"))
     
     # Check emcc
-    emcc_found, _ = check_command("emcc")
+    emcc_found, _ = check_command("emcc", need_version=False)
     if not emcc_found:
         print(color("❌ Emscripten (emcc) not found. Run 'python wasm-cli.py setup' for installation instructions.", "red"))
         return
     
     # Build
-    import sys
-    build_script = "build.bat" if sys.platform == "win32" else "./build.sh"
-    if run_command([build_script], cwd=c_project):
-        print(color("\n✅ Build successful!", "green"))
-        print(f"   Output: {c_project / 'www'}")
-        print(color("\n   Start server with: python wasm-cli.py serve", "cyan"))
+    if not IS_WIN:
+        # Nothing runs after the build, so replace this process instead of waiting
+        # on a child; build.sh reports its own result and next steps. Going through
+        # bash means the script doesn't need its execute bit.
+        sys.stdout.flush()
+        os.chdir(c_project)
+        try:
+            os.execvp("bash", ["bash", "build.sh"])
+        except OSError as e:
+            print(color(f"\n❌ Could not run build.sh: {e}", "red"))
     else:
-        print(color("\n❌ Build failed. Check the errors above.", "red"))
+        # Windows has no in-place exec, so run build.bat as a child and report the result
+        if run_command(["build.bat"], cwd=c_project):
+            print(color("\n✅ Build successful!", "green"))
+            print(f"   Output: {c_project / 'www'}")
+            print(color("\n   Start server with: python wasm-cli.py serve", "cyan"))
+        else:
+            print(color("\n❌ Build failed. Check the errors above.", "red"))
 
 
 def cmd_serve(port: int = 8080):
     """Start a local development server."""
+    import datetime
+    import email.utils
+    import http.server
+    
     print(color(f"\n🌐 Starting development server on port {port}...\n", "bold"))
     
     os.chdir(ROOT_DIR)
     
-    handler = http.server.SimpleHTTPRequestHandler
-    
-    with socketserver.TCPServer(("", port), handler) as httpd:
+    class Handler(http.server.SimpleHTTPRequestHandler):
+        """Serve pre-compressed .wasm.br / .wasm.gz siblings when the browser accepts them."""
+        
+        # Older Pythons map .wasm to application/octet-stream, which disables
+        # WebAssembly.instantiateStreaming() in the browser
+        extensions_map = {**http.server.SimpleHTTPRequestHandler.extensions_map, ".wasm": "application/wasm"}
+        
+        def end_headers(self):
+            self.send_header("Cache-Control", "public, max-age=0, must-revalidate")
+            # Cross-origin isolation, needed for SharedArrayBuffer / WASM threads
+            self.send_header("Cross-Origin-Opener-Policy", "same-origin")
+            self.send_header("Cross-Origin-Embedder-Policy", "require-corp")
+            super().end_headers()
+        
+        def accepted_encodings(self) -> set:
+            """Content codings from Accept-Encoding, minus any refused with q=0."""
+            accepted = set()
+            for token in self.headers.get("Accept-Encoding", "").split(","):
+                coding, *params = [part.strip() for part in token.split(";")]
+                q = 1.0
+                for param in params:
+                    if param.startswith("q="):
+                        try:
+                            q = float(param[2:])
+                        except ValueError:
+                            q = 0.0
+                if coding and q > 0:
+                    accepted.add(coding.lower())
+            return accepted
+        
+        def not_modified_since(self, mtime: float) -> bool:
+            """Mirror the base send_head's If-Modified-Since handling."""
+            if "If-Modified-Since" not in self.headers or "If-None-Match" in self.headers:
+                return False
+            try:
+                ims = email.utils.parsedate_to_datetime(self.headers["If-Modified-Since"])
+            except (TypeError, IndexError, OverflowError, ValueError):
+                return False
+            if ims.tzinfo is None:
+                ims = ims.replace(tzinfo=datetime.timezone.utc)
+            return int(mtime) <= ims.timestamp()
+        
+        def send_head(self):
+            path = self.translate_path(self.path)
+            if path.endswith(".wasm") and os.path.isfile(path):
+                accepted = self.accepted_encodings()
+                for encoding, suffix in (("br", ".br"), ("gzip", ".gz")):
+                    sibling = path + suffix
+                    # A sibling older than the module is left over from a previous build
+                    if (encoding not in accepted or not os.path.isfile(sibling)
+                            or os.stat(sibling).st_mtime < os.stat(path).st_mtime):
+                        continue
+                    try:
+                        f = open(sibling, "rb")
+                    except OSError:
+                        break
+                    fs = os.fstat(f.fileno())
+                    if self.not_modified_since(fs.st_mtime):
+                        f.close()
+                        self.send_response(304)
+                        self.send_header("Vary", "Accept-Encoding")
+                        self.end_headers()
+                        return None
+                    self.send_response(200)
+                    self.send_header("Content-Type", self.guess_type(path))
+                    self.send_header("Content-Encoding", encoding)
+                    self.send_header("Content-Length", str(fs.st_size))
+                    self.send_header("Last-Modified", self.date_time_string(fs.st_mtime))
+                    self.send_header("Vary", "Accept-Encoding")
+                    self.end_headers()
+                    return f
+            return super().send_head()
+    
+    # Threaded so the browser's parallel asset requests don't queue behind main.wasm
+    with http.server.ThreadingHTTPServer(("", port), Handler) as httpd:
         url = f"http://localhost:{port}"
         print(f"  Server running at: {color(url, 'cyan')}")
         print(f"  Press Ctrl+C to stop\n")
         
         # Open browser
-        webbrowser.open(url)
+        if _can_open_browser():
+            import webbrowser
+            webbrowser.open(url)
+        else:
+            print(f"  Open {url} in your browser\n")
         
         try:
             httpd.serve_forever()
@@ -279,149 +589,24 @@ def cmd_new(name: str):
     
     print(color(f"\n📦 Creating new C/WASM project: {name}\n", "bold"))
     
-    # Create directory structure
-    (project_dir / "src").mkdir(parents=True)
-    (project_dir / "www").mkdir(parents=True)
+    # Create directory structure and write every template in one pass
+    project_dir.mkdir(parents=True)
+    for subdir in ("src", "www"):
+        os.mkdir(project_dir / subdir)
     
-    # Create main.c
-    main_c = f'''// {name} - WASM module compiled from C
-#include <emscripten.h>
-#include <string.h>
-#include <stdlib.h>
-
-EMSCRIPTEN_KEEPALIVE
-int add(int a, int b) {{
-    return a + b;
-}}
-
-EMSCRIPTEN_KEEPALIVE
-int multiply(int a, int b) {{
-    return a * b;
-}}
-
-EMSCRIPTEN_KEEPALIVE
-int factorial(int n) {{
-    if (n <= 1) return 1;
-    return n * factorial(n - 1);
-}}
-
-EMSCRIPTEN_KEEPALIVE
-char* greet(const char* name) {{
-    static char buffer[256];
-    snprintf(buffer, sizeof(buffer), "Hello, %s!", name);
-    return buffer;
-}}
-
-int main() {{
-    return 0;
-}}
-'''
-    (project_dir / "src" / "main.c").write_text(main_c)
-    
-    # Create index.html
-    index_html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{name}</title>
-    <style>
-        body {{
-            font-family: system-ui, sans-serif;
-            max-width: 800px;
-            margin: 2rem auto;
-            padding: 1rem;
-            background: #1e1e1e;
-            color: #d4d4d4;
-        }}
-        h1 {{ color: #00d4ff; }}
-        .result {{
-            background: #0a0a15;
-            padding: 1rem;
-            border-radius: 8px;
-            font-family: monospace;
-            margin: 1rem 0;
-        }}
-        button {{
-            background: linear-gradient(90deg, #00d4ff, #7c3aed);
-            border: none;
-            padding: 0.8rem 1.5rem;
-            border-radius: 8px;
-            color: white;
-            cursor: pointer;
-            margin: 0.5rem;
-        }}
-    </style>
-</head>
-<body>
-    <h1>🚀 {name}</h1>
-    <p>Your C/WASM module is ready!</p>
-    
-    <div class="result" id="output">Loading WASM...</div>
-    
-    <button onclick="testAdd()">Test Add(5, 3)</button>
-    <button onclick="testFactorial()">Test Factorial(6)</button>
-    <button onclick="testGreet()">Test Greet</button>
-    
-    <script>
-        var Module = {{
-            onRuntimeInitialized: function() {{
-                document.getElementById('output').textContent = '✅ WASM loaded!';
-            }}
-        }};
-        
-        function testAdd() {{
-            const result = Module._add(5, 3);
-            document.getElementById('output').textContent = `add(5, 3) = ${{result}}`;
-        }}
-        
-        function testFactorial() {{
-            const result = Module._factorial(6);
-            document.getElementById('output').textContent = `factorial(6) = ${{result}}`;
-        }}
-        
-        function testGreet() {{
-            const greet = Module.cwrap('greet', 'string', ['string']);
-            document.getElementById('output').textContent = greet('WASM Developer');
-        }}
-    </script>
-    <script src="main.js"></script>
-</body>
-</html>
-'''
-    (project_dir / "www" / "index.html").write_text(index_html)
-    
-    # Create build script
-    import sys
-    if sys.platform == "win32":
-        build_script = f'''@echo off
-echo Building {name}...
-emcc src/main.c -o www/main.js ^
-    -s WASM=1 ^
-    -s EXPORTED_FUNCTIONS="['_add', '_multiply', '_factorial', '_greet', '_main']" ^
-    -s EXPORTED_RUNTIME_METHODS="['ccall', 'cwrap']" ^
-    -O2
-echo Done! Open www/index.html in your browser.
-'''
-        (project_dir / "build.bat").write_text(build_script)
-    else:
-        build_script = f'''#!/bin/bash
-echo "Building {name}..."
-emcc src/main.c -o www/main.js \\
-    -s WASM=1 \\
-    -s EXPORTED_FUNCTIONS="['_add', '_multiply', '_factorial', '_greet', '_main']" \\
-    -s EXPORTED_RUNTIME_METHODS="['ccall', 'cwrap']" \\
-    -O2
-echo "Done! Open www/index.html in your browser."
-'''
-        build_path = project_dir / "build.sh"
-        build_path.write_text(build_script)
-        build_path.chmod(0o755)
+    values = {"name": name}
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    for relpath, template, mode in TEMPLATE_FILES:
+        fd = os.open(project_dir / relpath, flags, mode)
+        try:
+            os.write(fd, template.format_map(values).encode())
+        finally:
+            os.close(fd)
     
     print(f"  {color('✓', 'green')} Created {project_dir}")
     print(f"\\n  Next steps:")
     print(f"    cd {project_dir}")
-    if os.name == 'nt':
+    if IS_WIN:
         print(f"    build.bat")
     else:
         print(f"    ./build.sh")
@@ -431,7 +616,7 @@ echo "Done! Open www/index.html in your browser."
 def cmd_help():
     """Show help information."""
     print_banner()
-    print(color("Commands:\n", "bold"))
+    lines = [color("Commands:\n", "bold")]
     commands = [
         ("setup", "Set up the WASM development environment"),
         ("check", "Check what tools are installed"),
@@ -443,14 +628,17 @@ def cmd_help():
     ]
     
     for cmd, desc in commands:
-        print(f"  {color(cmd, 'cyan'):20} {desc}")
-    
-    print(color("\nExamples:\n", "bold"))
-    print("  python wasm-cli.py setup")
-    print("  python wasm-cli.py lesson 1")
-    print("  python wasm-cli.py serve 3000")
-    print("  python wasm-cli.py new my-wasm-app")
-    print()
+        lines.append(f"  {color(cmd, 'cyan'):20} {desc}")
+    
+    lines += [
+        color("\nExamples:\n", "bold"),
+        "  python wasm-cli.py setup",
+        "  python wasm-cli.py lesson 1",
+        "  python wasm-cli.py serve 3000",
+        "  python wasm-cli.py new my-wasm-app",
+        "",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ═══════════════════════════════════════════════════════════════════════════